@@ -8,9 +8,13 @@
 #--------------------------------------------------------------------------------------------------
 
 import collections
+import functools
+import os
+import pickle
 import re
 import sys
 
+_result_cache_capacity = 10000
 _inflection_costs = {
   "np": 1.0,
   "vs": 1.0,
@@ -24,15 +28,56 @@ _inflection_costs = {
   "a": 4.0,
 }
 _re_word_boundary = re.compile(r"\W+")
-_re_ending_f = re.compile(r"(?i)(fe|f)$")
-_re_ending_spirant = re.compile(r"(?i)(o|s|ch|sh|x)$")
-_re_ending_vowel_y = re.compile(r"(?i)[aeiou]y$")
-_re_ending_y = re.compile(r"(?i)y$")
-_re_ending_ie = re.compile(r"(?i)ie$")
-_re_ending_e = re.compile(r"(?i)e$")
-_re_ending_long_vowel_consonant = re.compile(r"(?i)[aeiou]{2,}[^aeiouyx]$")
-_re_ending_short_vowel_consonant = re.compile(r"(?i)[aeiou][^aeiouyx]$")
-_re_ending_y = re.compile(r"(?i)y$")
+_re_simple_phrase = re.compile(r"\w+( \w+)*")
+_vowels = frozenset("aeiou")
+_nondoubling_consonant_exceptions = frozenset("aeiouyx")
+
+_SUFFIX_FE = 1 << 0
+_SUFFIX_F = 1 << 1
+_SUFFIX_SPIRANT = 1 << 2
+_SUFFIX_VOWEL_Y = 1 << 3
+_SUFFIX_Y = 1 << 4
+_SUFFIX_IE = 1 << 5
+_SUFFIX_E = 1 << 6
+_SUFFIX_LONG_VOWEL_CONSONANT = 1 << 7
+_SUFFIX_SHORT_VOWEL_CONSONANT = 1 << 8
+
+
+def _ClassifySuffix(lower, _vowels=_vowels,
+                    _exceptions=_nondoubling_consonant_exceptions):
+  """Classifies the tail of the given lowercased word in a single pass.
+
+  The trailing default arguments bind module globals as locals to avoid
+  LOAD_GLOBAL lookups in this hot helper; callers pass only the word.
+
+  :param lower: The lowercased word string.
+  :return: A bitmask of the _SUFFIX_* classes matching the word ending.
+  """
+  if not lower: return 0
+  size = len(lower)
+  last = lower[-1]
+  second = lower[-2] if size >= 2 else "\0"
+  flags = 0
+  if last == "f":
+    flags |= _SUFFIX_F
+  elif last == "e":
+    flags |= _SUFFIX_E
+    if second == "f":
+      flags |= _SUFFIX_FE
+    elif second == "i":
+      flags |= _SUFFIX_IE
+  elif last == "y":
+    flags |= _SUFFIX_Y
+    if second in _vowels:
+      flags |= _SUFFIX_VOWEL_Y
+  if last in "osx" or (last == "h" and second in "cs"):
+    flags |= _SUFFIX_SPIRANT
+  if last not in _exceptions and second in _vowels:
+    if size >= 3 and lower[-3] in _vowels:
+      flags |= _SUFFIX_LONG_VOWEL_CONSONANT
+    else:
+      flags |= _SUFFIX_SHORT_VOWEL_CONSONANT
+  return flags
 
 
 class Inflector:
@@ -70,27 +115,40 @@ Searchメソッドは指定フレーズの原形を検索します。基本形
     :param data_path: The path of the TSV file of inflection data.
     """
     self.word_dict = {}
+    # 活用形から原形へのインデックス。キーも値もinternされた文字列を共有するため
+    # 追加のメモリはdict本体とエントリごとの小さなリストだけで済む。
     self.index = collections.defaultdict(list)
+    self._InitCaches()
+    costs = _inflection_costs
+    index = self.index
+    intern = sys.intern
     with open(data_path) as input_file:
       for line in input_file:
         fields = line.strip().split("\t")
         if len(fields) < 2: continue
-        orig = fields[0]
+        orig = intern(fields[0])
         attrs = {}
-        uniq_infls = set()
         for field in fields:
-          subfields = field.split(":")
-          if len(subfields) != 2: continue
-          label, value = subfields
-          if label in _inflection_costs:
-            infls = value.split(",")
-            attrs[label] = infls
-            for infl in set(infls):
-              self.index[infl].append(orig)
+          label, sep, value = field.partition(":")
+          if not sep or ":" in value: continue
+          if label in costs:
+            # 同じ文字列が複数のラベルや他の見出し語に共有されるためinternする
+            infls = [intern(x) for x in value.split(",")]
+            attrs[intern(label)] = infls
+            if len(infls) == 1:
+              index[infls[0]].append(orig)
+            else:
+              for infl in set(infls):
+                index[infl].append(orig)
           elif label == "i":
             attrs["i"] = float(value)
         self.word_dict[orig] = attrs
 
+  def _InitCaches(self):
+    """Initializes the bounded result caches for Search and Inflect."""
+    self._search_cache = collections.OrderedDict()
+    self._inflect_cache = collections.OrderedDict()
+
   def InflectNoun(self, phrase, fbgen=False):
     """Generates inflections of the given noun phrase.
 
@@ -98,10 +156,7 @@ Searchメソッドは指定フレーズの原形を検索します。基本形
     :param fbgen: If true, fallback generation is done.
     :return: The result attribute map.
     """
-    ops = [(-1, 'np', GenerateNounPlural)]
-    if not fbgen:
-      ops = [(x[0], x[1], None) for x in ops]
-    return self._InflectImpl(phrase, ops)
+    return self._InflectImpl(phrase, _noun_ops if fbgen else _noun_ops_nogen)
 
   def InflectVerb(self, phrase, fbgen=False):
     """Generates inflections of the given verb phrase.
@@ -110,11 +165,7 @@ Searchメソッドは指定フレーズの原形を検索します。基本形
     :param fbgen: If true, fallback generation is done.
     :return: The result attribute map.
     """
-    ops = [(0, 'vs', GenerateVerbSingular), (0, 'vc', GenerateVerbPresentParticiple),
-           (0, 'vp', GenerateVerbPast), (0, 'vx', GenerateVerbPastParticiple)]
-    if not fbgen:
-      ops = [(x[0], x[1], None) for x in ops]
-    return self._InflectImpl(phrase, ops)
+    return self._InflectImpl(phrase, _verb_ops if fbgen else _verb_ops_nogen)
 
   def InflectAdjective(self, phrase, fbgen=False):
     """Generates inflections of the given adjective phrase.
@@ -123,10 +174,7 @@ Searchメソッドは指定フレーズの原形を検索します。基本形
     :param fbgen: If true, fallback generation is done.
     :return: The result attribute map.
     """
-    ops = [(0, 'ajc', GenerateAdjectiveComparative), (0, 'ajs', GenerateAdjectiveSuperative)]
-    if not fbgen:
-      ops = [(x[0], x[1], None) for x in ops]
-    return self._InflectImpl(phrase, ops)
+    return self._InflectImpl(phrase, _adjective_ops if fbgen else _adjective_ops_nogen)
 
   def InflectAdverb(self, phrase, fbgen=False):
     """Generates inflections of the given adverb phrase.
@@ -135,10 +183,7 @@ Searchメソッドは指定フレーズの原形を検索します。基本形
     :param fbgen: If true, fallback generation is done.
     :return: The result attribute map.
     """
-    ops = [(-1, 'avc', GenerateAdverbComparative), (-1, 'avs', GenerateAdverbSuperative)]
-    if not fbgen:
-      ops = [(x[0], x[1], None) for x in ops]
-    return self._InflectImpl(phrase, ops)
+    return self._InflectImpl(phrase, _adverb_ops if fbgen else _adverb_ops_nogen)
 
   def Inflect(self, phrase, fbgen=False):
     """Generates inflections of the given phrase as any part-of-speech.
@@ -147,14 +192,16 @@ Searchメソッドは指定フレーズの原形を検索します。基本形
     :param fbgen: If true, fallback generation is done.
     :return: The result attribute map.
     """
-    ops = [(-1, 'np', GenerateNounPlural),
-           (0, 'vs', GenerateVerbSingular), (0, 'vc', GenerateVerbPresentParticiple),
-           (0, 'vp', GenerateVerbPast), (0, 'vx', GenerateVerbPastParticiple),
-           (0, 'ajc', GenerateAdjectiveComparative), (0, 'ajs', GenerateAdjectiveSuperative),
-           (-1, 'avc', GenerateAdverbComparative), (-1, 'avs', GenerateAdverbSuperative)]
-    if not fbgen:
-      ops = [(x[0], x[1], None) for x in ops]
-    return self._InflectImpl(phrase, ops)
+    cache_key = (phrase, fbgen)
+    cached = self._inflect_cache.get(cache_key)
+    if cached is not None:
+      return {k: list(v) if isinstance(v, tuple) else v for k, v in cached.items()}
+    out_attrs = self._InflectImpl(phrase, _all_ops if fbgen else _all_ops_nogen)
+    self._inflect_cache[cache_key] = {
+      k: tuple(v) if isinstance(v, list) else v for k, v in out_attrs.items()}
+    if len(self._inflect_cache) > _result_cache_capacity:
+      self._inflect_cache.popitem(last=False)
+    return out_attrs
 
   def Search(self, phrase):
     """Searches for potential phrase information matching the given inflected phrase.
@@ -163,61 +210,75 @@ Searchメソッドは指定フレーズの原形を検索します。基本形
     :return: A list of tuples. Each tuple has the word in the base form, its occurrence cost, and
     a list of form labels of the given phrase.
     """
+    cached = self._search_cache.get(phrase)
+    if cached is not None:
+      return [(base, score, list(labels)) for base, score, labels in cached]
     tokens = [x for x in _re_word_boundary.split(phrase.strip()) if x]
     orig_phrase = " ".join(tokens)
     matches = []
     uniq_bases = {orig_phrase}
-    base_attrs = self.word_dict.get(orig_phrase)
+    word_dict_get = self.word_dict.get
+    # defaultdictへの添字アクセスは空エントリを作ってしまうためgetを使う
+    index_get = self.index.get
+    costs_get = _inflection_costs.get
+    base_attrs = word_dict_get(orig_phrase)
     if base_attrs:
       idf = base_attrs.get("i") or 20.0
       matches.append((orig_phrase, idf, ["o"]))
-    for base in self.index.get(orig_phrase) or []:
+    for base in index_get(orig_phrase) or []:
       if base in uniq_bases: continue
-      base_attrs = self.word_dict.get(base)
+      base_attrs = word_dict_get(base)
       if not base_attrs: continue
       idf = base_attrs.get("i") or 20
       min_cost = 10
       form_labels = []
       for key, value in base_attrs.items():
-        label_cost = _inflection_costs.get(key)
+        label_cost = costs_get(key)
         if not label_cost: continue
-        for infl in value:
-          if infl == orig_phrase:
-            min_cost = min(min_cost, label_cost)
-            form_labels.append(key)
-            break
-          label_cost += 3.0
+        try:
+          infl_index = value.index(orig_phrase)
+        except ValueError:
+          continue
+        label_cost += 3.0 * infl_index
+        if label_cost < min_cost:
+          min_cost = label_cost
+        form_labels.append(key)
       matches.append((base, idf + min_cost, form_labels))
       uniq_bases.add(base)
-    matches = sorted(matches, key=lambda x: (x[1], x[0]))
     if not matches and len(tokens) > 1:
       i = 0
       while i < len(tokens):
         token = tokens[i]
-        bases = [token] + (self.index.get(token) or [])
+        bases = [token] + (index_get(token) or [])
         base_tokens = tokens.copy()
         for base in bases:
           base_tokens[i] = base
           base_phrase = " ".join(base_tokens)
           if base_phrase in uniq_bases: continue
-          base_attrs = self.word_dict.get(base)
+          base_attrs = word_dict_get(base)
           if not base_attrs: continue
           idf = (base_attrs.get("i") or 20) + 20
           min_cost = 10
           form_labels = []
           for key, value in base_attrs.items():
-            label_cost = _inflection_costs.get(key)
+            label_cost = costs_get(key)
             if not label_cost: continue
-            for infl in value:
-              if infl == token:
-                min_cost = min(min_cost, label_cost)
-                form_labels.append(key)
-                break
-              label_cost += 3.0
+            try:
+              infl_index = value.index(token)
+            except ValueError:
+              continue
+            label_cost += 3.0 * infl_index
+            if label_cost < min_cost:
+              min_cost = label_cost
+            form_labels.append(key)
           matches.append((base_phrase, idf + min_cost, form_labels))
           uniq_bases.add(base_phrase)
         i += 1
     matches = sorted(matches, key=lambda x: (x[1], x[0]))
+    self._search_cache[phrase] = tuple(
+      (base, score, tuple(labels)) for base, score, labels in matches)
+    if len(self._search_cache) > _result_cache_capacity:
+      self._search_cache.popitem(last=False)
     return matches
 
   def LookupPhraseInfo(self, phrase):
@@ -229,16 +290,26 @@ Searchメソッドは指定フレーズの原形を検索します。基本形
     attrs = self.word_dict.get(phrase)
     return attrs.copy() if attrs else None
 
-  def _InflectImpl(self, phrase, ops):
+  def _InflectImpl(self, phrase, ops, _fullmatch=_re_simple_phrase.fullmatch,
+                   _split=_re_word_boundary.split):
     """Generates inflections of the given phrase with configurations.
 
+    The trailing default arguments bind the precompiled pattern methods as
+    locals to avoid LOAD_GLOBAL lookups; callers pass only phrase and ops.
+
     :param phrase: The base form string of a phrase.
     :param position: The position of the token to modify.
     :param ops: A list of focus positions, labels and generator functions.
     :return: The result attribute map.
     """
-    tokens = [x for x in _re_word_boundary.split(phrase.strip()) if x]
-    orig_phrase = " ".join(tokens)
+    stripped = phrase.strip()
+    if _fullmatch(stripped):
+      # 既に正規化済みのフレーズは分割・再結合を省略する（トークン化は必要時まで遅延）
+      tokens = None
+      orig_phrase = stripped
+    else:
+      tokens = [x for x in _split(stripped) if x]
+      orig_phrase = " ".join(tokens)
     out_attrs = {"o": orig_phrase}
     dict_attrs = self.word_dict.get(orig_phrase) or {}
     phrase_labels = []
@@ -253,6 +324,8 @@ Searchメソッドは指定フレーズの原形を検索します。基本形
     if idf:
       out_attrs["_pi"] = idf
     if len(phrase_labels) == len(ops): return out_attrs
+    if tokens is None:
+      tokens = orig_phrase.split(" ")
     token_labels = []
     for position, label, generator in ops:
       if position >= 0:
@@ -280,76 +353,156 @@ Searchメソッドは指定フレーズの原形を検索します。基本形
     return out_attrs
 
 
+_cache_version = 2
+
+
+def _LoadCachedInflector(cache_path, data_path):
+  """Loads a previously cached Inflector if it is still up to date.
+
+  The cache stores only plain data structures, never class instances, so it
+  stays loadable regardless of how this module was imported.
+
+  :param cache_path: The path of the cache file.
+  :param data_path: The path of the TSV file the cache was built from.
+  :return: The cached Inflector, or None if the cache is absent or stale.
+  """
+  try:
+    if os.path.getmtime(cache_path) < os.path.getmtime(data_path):
+      return None
+    with open(cache_path, "rb") as input_file:
+      version, word_dict, index_items = pickle.load(input_file)
+    if version != _cache_version: return None
+    inflector = Inflector.__new__(Inflector)
+    inflector._InitCaches()
+    inflector.word_dict = word_dict
+    inflector.index = collections.defaultdict(list, index_items)
+    return inflector
+  except (OSError, pickle.PickleError, EOFError, ValueError, TypeError,
+          AttributeError, ImportError):
+    return None
+
+
+def _SaveCachedInflector(cache_path, inflector):
+  """Saves the given Inflector to the cache file, best effort.
+
+  The data is written to a process-private temporary file and atomically
+  renamed into place, so concurrent writers (e.g. a pool of worker
+  processes each loading the Inflector) can never leave a torn cache.
+
+  :param cache_path: The path of the cache file.
+  :param inflector: The Inflector to save.
+  """
+  tmp_path = "{}.tmp.{}".format(cache_path, os.getpid())
+  try:
+    with open(tmp_path, "wb") as output_file:
+      pickle.dump((_cache_version, inflector.word_dict, dict(inflector.index)),
+                  output_file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+  except OSError:
+    try:
+      os.remove(tmp_path)
+    except OSError:
+      pass
+
+
+@functools.lru_cache(maxsize=4)
+def GetInflector(data_path):
+  """Gets an Inflector for the given data file, reusing already loaded ones.
+
+  The parsed lexicon is additionally cached on disk next to the data file, so
+  later processes skip the TSV parse entirely.  Cache maintenance is best
+  effort: a stale, corrupt or unwritable cache silently falls back to parsing.
+
+  :param data_path: The path of the TSV file of inflection data.
+  :return: The Inflector instance for the data file.
+  """
+  cache_path = data_path + ".cache"
+  inflector = _LoadCachedInflector(cache_path, data_path)
+  if inflector: return inflector
+  inflector = Inflector(data_path)
+  _SaveCachedInflector(cache_path, inflector)
+  return inflector
+
+
+@functools.lru_cache(maxsize=65536)
 def GenerateNounPlural(word):
   """Generates the plural form of the given noun single word.
 
   :param word: The base form string of a noun single word.
   :return: The result string.
   """
-  if _re_ending_f.search(word):
-    return _re_ending_f.sub("ves", word)
-  if _re_ending_spirant.search(word):
+  flags = _ClassifySuffix(word.lower())
+  if flags & _SUFFIX_FE:
+    return word[:-2] + "ves"
+  if flags & _SUFFIX_F:
+    return word[:-1] + "ves"
+  if flags & _SUFFIX_SPIRANT:
     return word + "es"
-  if _re_ending_vowel_y.search(word):
+  if flags & _SUFFIX_VOWEL_Y:
     return word + "s"
-  if _re_ending_y.search(word):
+  if flags & _SUFFIX_Y:
     return word[:-1] + "ies"
   return word + "s"
 
 
+@functools.lru_cache(maxsize=65536)
 def GenerateVerbSingular(word):
   """Generates the third-person singular form of the given verb single word.
 
   :param word: The base form string of a verb single word.
   :return: The result string.
   """
-  if _re_ending_spirant.search(word):
+  flags = _ClassifySuffix(word.lower())
+  if flags & _SUFFIX_SPIRANT:
     return word + "es"
-  if _re_ending_vowel_y.search(word):
+  if flags & _SUFFIX_VOWEL_Y:
     return word + "s"
-  if _re_ending_y.search(word):
+  if flags & _SUFFIX_Y:
     return word[:-1] + "ies"
   return word + "s"
 
 
+@functools.lru_cache(maxsize=65536)
 def GenerateVerbPresentParticiple(word):
   """Generates the present participle form of the given verb single word.
 
   :param word: The base form string of a verb single word.
   :return: The result string.
   """
-  if _re_ending_ie.search(word):
+  flags = _ClassifySuffix(word.lower())
+  if flags & _SUFFIX_IE:
     return word[:-2] + "ying"
-  if _re_ending_e.search(word):
+  if flags & _SUFFIX_E:
     return word[:-1] + "ing"
-  if _re_ending_long_vowel_consonant.search(word):
+  if flags & _SUFFIX_LONG_VOWEL_CONSONANT:
     return word + "ing"
-  if _re_ending_short_vowel_consonant.search(word):
+  if flags & _SUFFIX_SHORT_VOWEL_CONSONANT:
     return word + word[-1] + "ing"
   return word + "ing"
 
 
+@functools.lru_cache(maxsize=65536)
 def GenerateVerbPast(word):
   """Generates the past form of the given verb single word.
 
   :param word: The base form string of a verb single word.
   :return: The result string.
   """
-  if _re_ending_vowel_y.search(word):
+  flags = _ClassifySuffix(word.lower())
+  if flags & _SUFFIX_VOWEL_Y:
     return word + "ed"
-  if _re_ending_y.search(word):
+  if flags & _SUFFIX_Y:
     return word[:-1] + "ied"
-  if _re_ending_long_vowel_consonant.search(word):
+  if flags & _SUFFIX_LONG_VOWEL_CONSONANT:
     return word + "ed"
-  if _re_ending_short_vowel_consonant.search(word):
+  if flags & _SUFFIX_SHORT_VOWEL_CONSONANT:
     return word + word[-1] + "ed"
-  if _re_ending_y.search(word):
-    return word[:-1] + "ied"
-  if _re_ending_e.search(word):
+  if flags & _SUFFIX_E:
     return word + "d"
   return word + "ed"
 
 
+@functools.lru_cache(maxsize=65536)
 def GenerateVerbPastParticiple(word):
   """Generates the past participle form of the given verb single word.
 
@@ -359,48 +512,49 @@ def GenerateVerbPastParticiple(word):
   return GenerateVerbPast(word)
 
 
+@functools.lru_cache(maxsize=65536)
 def GenerateAdjectiveComparative(word):
   """Generates the comparative form of the given adjective single word.
 
   :param word: The base form string of an adjective single word.
   :return: The result string.
   """
-  if _re_ending_vowel_y.search(word):
+  flags = _ClassifySuffix(word.lower())
+  if flags & _SUFFIX_VOWEL_Y:
     return word + "er"
-  if _re_ending_y.search(word):
+  if flags & _SUFFIX_Y:
     return word[:-1] + "ier"
-  if _re_ending_long_vowel_consonant.search(word):
+  if flags & _SUFFIX_LONG_VOWEL_CONSONANT:
     return word + "er"
-  if _re_ending_short_vowel_consonant.search(word):
+  if flags & _SUFFIX_SHORT_VOWEL_CONSONANT:
     return word + word[-1] + "er"
-  if _re_ending_y.search(word):
-    return word[:-1] + "ier"
-  if _re_ending_e.search(word):
+  if flags & _SUFFIX_E:
     return word + "r"
   return word + "er"
 
 
+@functools.lru_cache(maxsize=65536)
 def GenerateAdjectiveSuperative(word):
   """Generates the superative form of the given adjective single word.
 
   :param word: The base form string of an adjective single word.
   :return: The result string.
   """
-  if _re_ending_vowel_y.search(word):
+  flags = _ClassifySuffix(word.lower())
+  if flags & _SUFFIX_VOWEL_Y:
     return word + "est"
-  if _re_ending_y.search(word):
+  if flags & _SUFFIX_Y:
     return word[:-1] + "iest"
-  if _re_ending_long_vowel_consonant.search(word):
+  if flags & _SUFFIX_LONG_VOWEL_CONSONANT:
     return word + "est"
-  if _re_ending_short_vowel_consonant.search(word):
+  if flags & _SUFFIX_SHORT_VOWEL_CONSONANT:
     return word + word[-1] + "est"
-  if _re_ending_y.search(word):
-    return word[:-1] + "iest"
-  if _re_ending_e.search(word):
+  if flags & _SUFFIX_E:
     return word + "st"
   return word + "est"
 
 
+@functools.lru_cache(maxsize=65536)
 def GenerateAdverbComparative(word):
   """Generates the comparative form of the given adverb single word.
 
@@ -410,6 +564,7 @@ def GenerateAdverbComparative(word):
   return GenerateAdjectiveComparative(word)
 
 
+@functools.lru_cache(maxsize=65536)
 def GenerateAdverbSuperative(word):
   """Generates the superative form of the given adverb single word.
 
@@ -419,6 +574,22 @@ def GenerateAdverbSuperative(word):
   return GenerateAdjectiveSuperative(word)
 
 
+# 各Inflectメソッドが使う (位置, ラベル, 生成関数) のタプルを事前に構築しておく
+_noun_ops = ((-1, 'np', GenerateNounPlural),)
+_verb_ops = ((0, 'vs', GenerateVerbSingular), (0, 'vc', GenerateVerbPresentParticiple),
+             (0, 'vp', GenerateVerbPast), (0, 'vx', GenerateVerbPastParticiple))
+_adjective_ops = ((0, 'ajc', GenerateAdjectiveComparative),
+                  (0, 'ajs', GenerateAdjectiveSuperative))
+_adverb_ops = ((-1, 'avc', GenerateAdverbComparative),
+               (-1, 'avs', GenerateAdverbSuperative))
+_all_ops = _noun_ops + _verb_ops + _adjective_ops + _adverb_ops
+_noun_ops_nogen = tuple((x[0], x[1], None) for x in _noun_ops)
+_verb_ops_nogen = tuple((x[0], x[1], None) for x in _verb_ops)
+_adjective_ops_nogen = tuple((x[0], x[1], None) for x in _adjective_ops)
+_adverb_ops_nogen = tuple((x[0], x[1], None) for x in _adverb_ops)
+_all_ops_nogen = tuple((x[0], x[1], None) for x in _all_ops)
+
+
 def _ShowUsageAndDie():
   print("Usage:", file=sys.stderr)
   print("  english_inflections.py [--data path] [--fbgen] [--pos str] [--form str] query",
@@ -446,7 +617,7 @@ def _RunTest(data_path):
           GenerateAdjectiveComparative(phrase),
           GenerateAdjectiveSuperative(phrase))
   print("---- Inflect functions ----")
-  inflector = Inflector(data_path)
+  inflector = GetInflector(data_path)
   for phrase in base_phrases:
     print(phrase + ":", inflector.Inflect(phrase))
   print("---- Search function ----")
@@ -455,7 +626,7 @@ def _RunTest(data_path):
 
 
 def _RunInflection(data_path, query, is_fbgen, focus_pos, focus_form):
-  inflector = Inflector(data_path)
+  inflector = GetInflector(data_path)
   if focus_pos in ("n", "noun"):
     attrs = inflector.InflectNoun(query, is_fbgen)
   elif focus_pos in ("v", "verb"):
@@ -476,7 +647,7 @@ def _RunInflection(data_path, query, is_fbgen, focus_pos, focus_form):
     
 
 def _RunSearch(data_path, query):
-  inflector = Inflector(data_path)
+  inflector = GetInflector(data_path)
   for base, score, labels in inflector.Search(query):
     print("{}\t{:.2f}\t{}".format(base, score, ",".join(labels)))
 
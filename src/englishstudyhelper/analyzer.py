@@ -1,8 +1,12 @@
 """
 テキスト分析を行うモジュール
 """
+import concurrent.futures
+import functools
+import os
 import re
 import ssl
+from operator import attrgetter
 from typing import Dict, List, Tuple
 
 import nltk
@@ -43,6 +47,34 @@ def ensure_nltk_resources():
 ensure_nltk_resources()
 
 
+# テキストクリーニング用の変換テーブルとパターン（モジュールロード時に一度だけ構築する）
+_backslash_table = str.maketrans('', '', '\\')
+_re_whitespace = re.compile(r'\s+')
+
+# 単語分割用のトークナイザ（モジュールロード時に一度だけ構築する）
+# nltk.word_tokenizeが内部で使うものと同じクラスを使い、
+# 一括処理でも1文ずつの処理と同一のトークン列になるようにする
+_word_tokenizer = nltk.tokenize.NLTKWordTokenizer()
+
+# 品詞タガーのシングルトンインスタンス
+_tagger = None
+
+
+def get_tagger():
+    """
+    NLTKの品詞タガーを取得する
+
+    初回呼び出し時のみモデルをロードし、以降は同じインスタンスを再利用する。
+
+    Returns:
+        nltk.tag.PerceptronTagger: 品詞タガー
+    """
+    global _tagger
+    if _tagger is None:
+        _tagger = nltk.tag.PerceptronTagger()
+    return _tagger
+
+
 def read_text_file(file_path: str) -> str:
     """
     テキストファイルを読み込む
@@ -73,11 +105,11 @@ def clean_text(text: str) -> str:
     Returns:
         str: クリーニングされたテキスト
     """
-    # バックスラッシュを削除
-    text = text.replace('\\', '')
+    # バックスラッシュを削除（変換テーブルによる一括削除）
+    text = text.translate(_backslash_table)
 
-    # 複数の空白を1つの空白に置換
-    text = re.sub(r'\s+', ' ', text)
+    # 複数の空白を1つの空白に置換（コンパイル済みパターンを使用）
+    text = _re_whitespace.sub(' ', text)
 
     return text
 
@@ -114,12 +146,90 @@ def tokenize_and_tag(sentence: str) -> List[Tuple[str, str]]:
     # 単語に分割
     tokens = nltk.word_tokenize(sentence)
 
-    # 品詞タグ付け
-    tagged_tokens = nltk.pos_tag(tokens)
+    # 品詞タグ付け（タガーは一度だけロードして再利用する）
+    tagged_tokens = get_tagger().tag(tokens)
 
     return tagged_tokens
 
 
+def tokenize_and_tag_batch(sentences: List[str]) -> List[List[Tuple[str, str]]]:
+    """
+    複数の文をまとめてトークン化し、品詞タグを付ける
+
+    文ごとにtokenize_and_tagを呼ぶよりタガー呼び出しの
+    オーバーヘッドが少なく、大きな文書では並列処理される。
+
+    Args:
+        sentences (List[str]): 文のリスト
+
+    Returns:
+        List[List[Tuple[str, str]]]: 文ごとの (単語, 品詞タグ) のリスト
+    """
+    return _tag_sentences(sentences)
+
+
+@functools.lru_cache(maxsize=200_000)
+def _get_base_form_cached(word: str, pos: str) -> str:
+    """
+    単語の原型取得をメモ化するヘルパー
+
+    結果は決定的なので、複数ファイルの分析にまたがって再利用できる。
+
+    Args:
+        word (str): 小文字化された単語
+        pos (str): 品詞タグ
+
+    Returns:
+        str: 単語の原型
+    """
+    return dictionary.get_dictionary().get_word_base_form(word, pos)
+
+
+# これ以上の文数の場合のみ並列タグ付けを行う（少量ではプロセス起動コストが勝る）
+_parallel_sentence_threshold = 500
+
+
+def _tag_sentence_chunk(sentences: List[str]) -> List[List[Tuple[str, str]]]:
+    """
+    文のリストをトークン化し、一括で品詞タグを付ける
+
+    Args:
+        sentences (List[str]): 文のリスト
+
+    Returns:
+        List[List[Tuple[str, str]]]: 文ごとの (単語, 品詞タグ) のリスト
+    """
+    token_lists = [_word_tokenizer.tokenize(s) for s in sentences]
+    return get_tagger().tag_sents(token_lists)
+
+
+def _tag_sentences(sentences: List[str]) -> List[List[Tuple[str, str]]]:
+    """
+    文のリストに品詞タグを付ける（大きな文書はプロセス並列で処理する）
+
+    Args:
+        sentences (List[str]): 文のリスト
+
+    Returns:
+        List[List[Tuple[str, str]]]: 文ごとの (単語, 品詞タグ) のリスト
+    """
+    workers = os.cpu_count() or 1
+    if len(sentences) < _parallel_sentence_threshold or workers <= 1:
+        return _tag_sentence_chunk(sentences)
+
+    # フォーク前にタガーをロードしておくと子プロセスと共有される
+    get_tagger()
+
+    chunk_size = -(-len(sentences) // workers)
+    chunks = [sentences[i:i + chunk_size] for i in range(0, len(sentences), chunk_size)]
+
+    tagged_sentences: List[List[Tuple[str, str]]] = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        for part in executor.map(_tag_sentence_chunk, chunks):
+            tagged_sentences.extend(part)
+    return tagged_sentences
+
+
 def analyze_text(text: str) -> Dict[str, Word]:
     """
     テキストを分析し、単語の出現回数と例文を収集する
@@ -139,10 +249,10 @@ def analyze_text(text: str) -> Dict[str, Word]:
     # 単語を収集
     word_dict = {}
 
-    for sentence in sentences:
-        # 文をトークン化し、品詞タグを付ける
-        tagged_tokens = tokenize_and_tag(sentence)
+    # 全文をまとめてトークン化し、一括で品詞タグを付ける（文ごとのタガー呼び出しを省く）
+    tagged_sentences = _tag_sentences(sentences)
 
+    for sentence, tagged_tokens in zip(sentences, tagged_sentences):
         # 各単語を処理
         for token, pos in tagged_tokens:
             # 記号や数字は除外
@@ -150,19 +260,21 @@ def analyze_text(text: str) -> Dict[str, Word]:
                 continue
 
             # 単語と品詞の組み合わせのキーを作成
-            word_key = f"{token.lower()}_{pos}"
+            word = token.lower()
+            word_key = f"{word}_{pos}"
 
-            # 辞書に単語を追加または更新
-            if word_key not in word_dict:
-                word = token.lower()
-                org = dictionary.get_dictionary().get_word_base_form(word, pos)
-                word_dict[word_key] = Word(text=word, org=org, pos=pos)
+            # 辞書から取得（トークンごとのハッシュ検索を1回に抑える）
+            word_obj = word_dict.get(word_key)
+            if word_obj is None:
+                org = _get_base_form_cached(word, pos)
+                word_obj = Word(text=word, org=org, pos=pos)
+                word_dict[word_key] = word_obj
 
             # 出現回数をインクリメント
-            word_dict[word_key].increment_count()
+            word_obj.increment_count()
 
             # 例文を追加
-            word_dict[word_key].add_example(sentence)
+            word_obj.add_example(sentence)
 
     return word_dict
 
@@ -177,15 +289,11 @@ def filter_words(word_dict: Dict[str, Word]) -> Dict[str, Word]:
     Returns:
         Dict[str, Word]: フィルタリングされた単語オブジェクトの辞書
     """
-    config = get_config()
-    filtered_dict = {}
-
-    for word_key, word_obj in word_dict.items():
-        # 除外すべき単語かどうかを判定
-        if not config.should_exclude_word(word_obj.text, word_obj.pos):
-            filtered_dict[word_key] = word_obj
+    # 判定メソッドをローカルに束縛し、辞書内包表記で一括フィルタリングする
+    should_exclude = get_config().should_exclude_word
 
-    return filtered_dict
+    return {word_key: word_obj for word_key, word_obj in word_dict.items()
+            if not should_exclude(word_obj.text, word_obj.pos)}
 
 
 def sort_words_by_count(word_dict: Dict[str, Word]) -> List[Word]:
@@ -198,7 +306,7 @@ def sort_words_by_count(word_dict: Dict[str, Word]) -> List[Word]:
     Returns:
         List[Word]: 出現回数順にソートされた単語オブジェクトのリスト
     """
-    return sorted(word_dict.values(), key=lambda w: w.count, reverse=True)
+    return sorted(word_dict.values(), key=attrgetter('count'), reverse=True)
 
 def sort_words_by_dict(word_dict: Dict[str, Word]) -> List[Word]:
     """
@@ -209,7 +317,7 @@ def sort_words_by_dict(word_dict: Dict[str, Word]) -> List[Word]:
     Returns:
         List[Word]: 辞書順にソートされた単語オブジェクトのリスト
     """
-    return sorted(word_dict.values(), key=lambda w: w.text)
+    return sorted(word_dict.values(), key=attrgetter('text'))
 
 def analyze_file(file_path: str) -> List[Word]:
     """
@@ -6,6 +6,13 @@ import os
 from typing import Dict, List, Any
 
 
+# 否定形の短縮形がパースミスで分断された際に残る語幹
+_negative_contraction_stems = frozenset([
+    "wasn", "isn", "doesn", "didn", "haven", "hadn", "won", "wouldn", "couldn",
+    "shouldn", "mightn", "mustn",
+])
+
+
 class Config:
     """
     設定ファイルを読み込み、アクセスするためのクラス
@@ -26,6 +33,10 @@ class Config:
         self.config_path = config_path
         self.config_data = self._load_config()
 
+        # 除外判定で毎回リストを作り直さないよう、frozensetとして事前計算しておく
+        self._exclude_pos = frozenset(self.config_data.get('exclude_pos', ()))
+        self._be_verbs = frozenset(self.config_data.get('be_verbs', ()))
+
     def _load_config(self) -> Dict[str, Any]:
         """
         設定ファイルを読み込む
@@ -92,16 +103,15 @@ class Config:
             return True
 
         # 品詞が除外リストに含まれる場合
-        if pos in self.get_exclude_pos():
+        if pos in self._exclude_pos:
             return True
 
         # be動詞の場合
-        if word.lower() in self.get_be_verbs():
+        if word.lower() in self._be_verbs:
             return True
 
         # 否定敬称略のパースミスの場合
-        if word in ["wasn", "isn", "doesn", "didn", "haven", "hadn", "won", "wouldn", "couldn", "shouldn", "mightn",
-                    "mustn"]:
+        if word in _negative_contraction_stems:
             return True
 
         return False
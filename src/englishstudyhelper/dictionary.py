@@ -9,12 +9,18 @@
 """
 import os
 import sqlite3
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
-from src.english_inflections.english_inflections import Inflector
+from src.english_inflections.english_inflections import GetInflector
 from .config import get_config
 
 
+# デフォルトのパスはインスタンス生成のたびに計算せず、インポート時に一度だけ求める
+_base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_default_db_path = os.path.join(_base_dir, 'ejdic-hand-sqlite', 'ejdict.sqlite3')
+_inflections_tsv_path = 'src/english_inflections/english_inflections.tsv'
+
+
 class Dictionary:
     """
     辞書検索機能を提供するクラス
@@ -29,13 +35,29 @@ class Dictionary:
         """
         if db_path is None:
             # デフォルトのパスを使用
-            base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            db_path = os.path.join(base_dir, 'ejdic-hand-sqlite', 'ejdict.sqlite3')
+            db_path = _default_db_path
 
         self.db_path = db_path
 
-        # Inflectorの初期化
-        self.inflector = Inflector('src/english_inflections/english_inflections.tsv')
+        # 接続は最初の検索時に確立し、以降は使い回す
+        self._conn = None
+
+        # 同じ単語の検索を繰り返さないためのメモ化キャッシュ
+        self._translation_cache: Dict[tuple, Optional[str]] = {}
+        self._baseform_cache: Dict[str, Optional[str]] = {}
+
+        # reporter.get_verb_formsが使う (単語, 品詞) -> 活用形のキャッシュ。
+        # インスタンス単位に持つことで、別DBを指すインスタンス間で結果が混ざらない
+        self._verb_forms_cache: Dict[tuple, tuple] = {}
+
+        # itemsテーブル全体のインメモリコピー（最初の検索時にロードする）
+        self._mean_by_word: Optional[Dict[str, str]] = None
+
+        # "/"区切りを分割・トリム済みの訳語リスト（ロード時に一度だけ正規化する）
+        self._parts_by_word: Dict[str, list] = {}
+
+        # Inflectorの初期化（同じデータファイルのロード結果はプロセス内で共有される）
+        self.inflector = GetInflector(_inflections_tsv_path)
 
     def get_word_translation(self, word: str, max_translations: int = None) -> Optional[str]:
         """
@@ -53,13 +75,34 @@ class Dictionary:
         if max_translations is None:
             max_translations = get_config().get_max_translations()
 
+        # 同じ単語は文書中に何度も現れるため、整形済みの結果をメモ化しておく
+        cache_key = (word, max_translations)
+        if cache_key in self._translation_cache:
+            return self._translation_cache[cache_key]
+
         # 辞書DBから翻訳を取得
         translation = self._query_dictionary(word)
 
-        # 翻訳が見つからない場合はNoneを返す
-        if translation is None:
-            return None
+        # 翻訳が見つかった場合のみ整形する
+        if translation is not None:
+            translation = self._format_translation(
+                translation, max_translations, self._parts_by_word.get(word))
+
+        self._translation_cache[cache_key] = translation
+        return translation
+
+    def _format_translation(self, translation: str, max_translations: int = None, parts: list = None) -> str:
+        """
+        辞書DBの訳語文字列を表示用に整形する
+
+        Args:
+            translation (str): "/"区切りの訳語文字列
+            max_translations (int, optional): 返す訳語の最大数
+            parts (list, optional): 分割・トリム済みの訳語リスト。指定された場合は分割処理を省略する。
 
+        Returns:
+            str: 整形された訳語文字列
+        """
         # max_translationsの処理: 0以下なら空文字、正ならその数までに整形
         try:
             mt = int(max_translations) if max_translations is not None else int(get_config().get_max_translations())
@@ -68,10 +111,11 @@ class Dictionary:
         if mt is not None:
             if mt <= 0:
                 return ''
-            # 訳語を"/"で分割し、トリムして再結合
-            parts = [p.strip() for p in translation.split('/')]
-            # 空要素を除去
-            parts = [p for p in parts if p]
+            # 訳語を"/"で分割し、トリムして再結合（正規化済みリストがあれば再利用）
+            if parts is None:
+                parts = [p.strip() for p in translation.split('/')]
+                # 空要素を除去
+                parts = [p for p in parts if p]
             translation = ' / '.join(parts[:mt])
 
         # 100文字以上の翻訳は切り捨てる(末尾に"..."を追加)
@@ -80,6 +124,35 @@ class Dictionary:
 
         return translation
 
+    def get_translations_bulk(self, words: Iterable[str], max_translations: int = None) -> Dict[str, str]:
+        """
+        複数の単語の日本語訳をまとめて取得する
+
+        インメモリにロードしたitemsテーブルを使い、単語ごとの
+        SELECT発行を避ける。レポート生成のように大量の単語を引く
+        場面で効く。
+
+        Args:
+            words (Iterable[str]): 単語（原型）のリスト
+            max_translations (int, optional): 返す訳語の最大数。指定しない場合は設定ファイルの値を使用する。
+
+        Returns:
+            Dict[str, str]: 単語から整形済みの日本語訳への辞書。
+                           翻訳が見つからなかった単語はキーに含まれない。
+        """
+        means = self._load_items()
+        translations: Dict[str, str] = {}
+
+        for word in words:
+            if word in translations:
+                continue
+            mean = means.get(word)
+            if mean is not None:
+                translations[word] = self._format_translation(
+                    mean, max_translations, self._parts_by_word.get(word))
+
+        return translations
+
     def _query_dictionary(self, word: str) -> Optional[str]:
         """
         辞書DBから単語の翻訳を取得する
@@ -94,28 +167,54 @@ class Dictionary:
             この関数は純粋関数ではなく、DBアクセスという副作用を持つ。
             しかし、外部から直接呼び出されることはなく、get_word_translationから呼び出される。
         """
-        try:
-            # DBに接続
-            conn = self._get_connection()
+        return self._load_items().get(word)
 
-            # カーソルを取得
-            cursor = conn.cursor()
+    def _load_items(self) -> Dict[str, str]:
+        """
+        itemsテーブル全体をインメモリの辞書としてロードする
+
+        テーブルは12万行程度でメモリに収まるため、初回に一括ロードして
+        以降の検索をハッシュ探索1回にする。SQLiteのB-tree探索よりも
+        大幅に速く、バッチ処理ではロードコストはすぐに回収できる。
 
-            # 単語を検索
-            cursor.execute("SELECT mean FROM items WHERE word = ?", (word,))
+        Returns:
+            Dict[str, str]: 単語から訳語文字列への辞書。
+                           ロードに失敗した場合は空の辞書。
+        """
+        if self._mean_by_word is None:
+            try:
+                cursor = self._get_connection().execute("SELECT word, mean FROM items")
+                self._mean_by_word = dict(cursor.fetchall())
+            except sqlite3.Error:
+                # DBエラーが発生した場合は空の辞書として扱う
+                self._mean_by_word = {}
+
+            # 訳語の分割・トリムは検索のたびに繰り返さず、ここで一度だけ行う
+            self._parts_by_word = {
+                word: [p for p in (s.strip() for s in mean.split('/')) if p]
+                for word, mean in self._mean_by_word.items()
+            }
+        return self._mean_by_word
+
+    def _search_base_form(self, word: str) -> Optional[str]:
+        """
+        Inflectorで単語の原型を検索する
 
-            # 結果を取得
-            result = cursor.fetchone()
+        Args:
+            word (str): 単語
 
-            # 接続を閉じる
-            conn.close()
+        Returns:
+            Optional[str]: 推測された原型。推測できない場合は None を返す。
+        """
+        # 検索失敗も含めて結果をメモ化し、同じ単語の再検索を避ける
+        if word in self._baseform_cache:
+            return self._baseform_cache[word]
 
-            # 結果があれば翻訳を返す、なければNoneを返す
-            return result[0] if result else None
+        searched = self.inflector.Search(word)
+        base_form = searched[0][0] if searched and searched[0][0] else None
 
-        except sqlite3.Error:
-            # DBエラーが発生した場合はNoneを返す
-            return None
+        self._baseform_cache[word] = base_form
+        return base_form
 
     def _get_base_form(self, word: str, part_of_speech: str = None) -> str:
         """
@@ -128,36 +227,61 @@ class Dictionary:
         Returns:
             str: 推測された原型。推測できない場合は元の単語を返す。
         """
-        searched = self.inflector.Search(word)
-        if searched and searched[0][0]:
-            base_form = searched[0][0]
-        else:
+        base_form = self._search_base_form(word)
+        if base_form is None:
             raise ValueError("Inflector failed for word: " + word)
 
-        # それ以外の場合は元の単語を返す
         return base_form
 
     def _get_connection(self) -> sqlite3.Connection:
         """
         SQLite3データベースへの接続を取得する
 
+        接続は初回に一度だけ確立し、以降は同じ接続を再利用する。
+        検索のたびに接続を開閉すると、その開閉コストが検索自体を上回る。
+
         Returns:
             sqlite3.Connection: データベース接続
 
         Raises:
             sqlite3.Error: データベース接続に失敗した場合
         """
-        return sqlite3.connect(self.db_path)
+        if self._conn is None:
+            # "file:"で始まるパスはSQLiteのURI形式（インメモリDB等）として扱う
+            conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                   uri=self.db_path.startswith('file:'))
+            try:
+                # 読み取り専用用途に合わせたチューニング
+                # mmap経由でページを読むことでread(2)の往復を減らす
+                conn.execute("PRAGMA mmap_size=268435456")
+                # ページキャッシュを約40MBに拡大（負値はKiB単位）
+                conn.execute("PRAGMA cache_size=-40000")
+                # 一時領域はメモリに置く
+                conn.execute("PRAGMA temp_store=MEMORY")
+                # 辞書DBを誤って書き換えないよう読み取り専用にする
+                conn.execute("PRAGMA query_only=ON")
+            except sqlite3.Error:
+                # PRAGMAが使えない環境でも接続自体は利用する
+                pass
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """
+        保持しているデータベース接続を閉じる
+        """
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
 
     def get_word_base_form(self, word, pos):
-        # 単語を小文字に変換
-        word = word.lower()
+        # 単語を小文字に変換（既に小文字なら新しい文字列を作らない）
+        if not word.islower():
+            word = word.lower()
 
-        # 原型を推測
-        searched = self.inflector.Search(word)
-        if searched and searched[0][0]:
-            org = searched[0][0]
-        else:
+        # 原型を推測（結果は_search_base_formがメモ化している）
+        org = self._search_base_form(word)
+        if org is None:
             print("Inflector failed for word: " + word + ", pos: " + str(pos))
             org = word
 
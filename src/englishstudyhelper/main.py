@@ -2,11 +2,15 @@
 英語学習ヘルパーのメインモジュール
 """
 import argparse
+import concurrent.futures
 import json
 import logging
+import multiprocessing
 import os
+import stat
 import sys
 import traceback
+from itertools import repeat
 from pathlib import Path
 from traceback import print_stack
 from typing import List, Optional, Dict, Any
@@ -56,6 +60,38 @@ def load_grammar_points(json_path: Path) -> Optional[List[Dict[str, Any]]]:
         return None
 
 
+def _process_one(path: str, option: str, output_dir: str) -> str:
+    """
+    1ファイルを分析してレポートを保存する
+
+    ファイルごとの処理は独立しているため、プロセスプールのワーカーと
+    しても呼び出せるようモジュールレベルの関数にしている。
+
+    Args:
+        path (str): 分析対象ファイルのパス
+        option (str): オプション（例: no_translation）
+        output_dir (str): 出力ディレクトリのパス
+
+    Returns:
+        str: 保存したレポートのパス
+    """
+    print(f"テキストファイルを分析中: {path}")
+    words = analyze_file(path)
+    title = os.path.splitext(os.path.basename(path))[0]
+
+    # stem と JSON パス
+    input_dir = Path(os.path.dirname(path))
+    json_path = input_dir / f"{title}.json"
+    grammar_points = load_grammar_points(json_path)
+
+    # 新しい生成関数で統合
+    lines = generate_full_report_with_grammar(words, title, option, grammar_points)
+    output_path = os.path.join(output_dir, f"{title}_report.md")
+    save_full_report(lines, output_path)
+    print(f"レポートを保存しました: {output_path}")
+    return output_path
+
+
 def main(args: Optional[List[str]] = None) -> int:
     """
     メイン関数
@@ -86,23 +122,28 @@ def main(args: Optional[List[str]] = None) -> int:
             print(f"エラー: 設定ファイルが見つかりません: {config_path}", file=sys.stderr)
             return 1
 
-        # 出力ディレクトリを作成（存在しない場合作成）
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir, exist_ok=True)
+        # 出力ディレクトリを作成（既に存在する場合は何もしない）
+        os.makedirs(output_dir, exist_ok=True)
+
+        # 入力パスの存在確認と種別判定をstat 1回で済ませる
+        try:
+            input_stat = os.stat(input_path)
+        except FileNotFoundError:
+            print(f"エラー: 入力ファイルが見つかりません: {input_path}", file=sys.stderr)
+            return 1
 
         targets: List[str] = []
-        if os.path.isdir(input_path):
+        if stat.S_ISDIR(input_stat.st_mode):
             # ディレクトリ内の .md ファイルを処理
-            md_files = [os.path.join(input_path, f) for f in os.listdir(input_path) if f.lower().endswith('.md')]
+            # os.scandirはパス結合済みのDirEntryを返すため、listdir+joinより無駄がない
+            with os.scandir(input_path) as it:
+                md_files = [e.path for e in it if e.is_file() and e.name.lower().endswith('.md')]
             if not md_files:
                 print(f"エラー: 指定ディレクトリに .md ファイルが見つかりません: {input_path}", file=sys.stderr)
                 return 1
             targets = sorted(md_files)
         else:
             # 単一ファイルとして処理
-            if not os.path.exists(input_path):
-                print(f"エラー: 入力ファイルが見つかりません: {input_path}", file=sys.stderr)
-                return 1
             if not input_path.lower().endswith('.md'):
                 print(f"エラー: 入力ファイルは .md である必要があります: {input_path}", file=sys.stderr)
                 return 1
@@ -113,22 +154,21 @@ def main(args: Optional[List[str]] = None) -> int:
         logger = logging.getLogger(__name__)
 
         # 各ファイルを独立解析し、レポートを保存
-        for path in targets:
-            print(f"テキストファイルを分析中: {path}")
-            words = analyze_file(path)
-            title = os.path.splitext(os.path.basename(path))[0]
-
-            # stem と JSON パス
-            input_dir = Path(os.path.dirname(path))
-            stem = title
-            json_path = input_dir / f"{stem}.json"
-            grammar_points = load_grammar_points(json_path)
-
-            # 新しい生成関数で統合
-            lines = generate_full_report_with_grammar(words, title, option, grammar_points)
-            output_path = os.path.join(output_dir, f"{title}_report.md")
-            save_full_report(lines, output_path)
-            print(f"レポートを保存しました: {output_path}")
+        # ファイル間に依存はないため、複数ファイルの場合はプロセスプールで並列化する
+        if len(targets) > 1 and (os.cpu_count() or 1) > 1:
+            workers = min(len(targets), os.cpu_count())
+            # forkが使える環境では、ロード済みの辞書・Inflectorを
+            # 子プロセスがコピーオンライトで共有できるよう明示的に指定する
+            try:
+                mp_context = multiprocessing.get_context('fork')
+            except ValueError:
+                mp_context = None
+            with concurrent.futures.ProcessPoolExecutor(
+                    max_workers=workers, mp_context=mp_context) as executor:
+                list(executor.map(_process_one, targets, repeat(option), repeat(output_dir)))
+        else:
+            for path in targets:
+                _process_one(path, option, output_dir)
 
         return 0
 
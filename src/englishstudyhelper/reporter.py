@@ -1,13 +1,39 @@
 """
 分析結果をレポートとして出力するモジュール
 """
-import textwrap
-from typing import List, Dict, Optional, Tuple
+import functools
+import os
+import re
+import sys
+from typing import Any, Iterable, Iterator, List, Dict, Optional, Tuple
 
 from .config import get_config
-from .dictionary import get_dictionary, Dictionary
 from .word import Word
 
+# NOTE: .dictionary（およびその先の活用エンジン）はインポートが重いため、
+# 実際にレポートを生成する関数の中で遅延インポートする
+
+
+# 動詞とみなす品詞タグ（呼び出しのたびにリストを作り直さないよう定数化）
+_verb_pos_tags = frozenset(['VB', 'VBD', 'VBG', 'VBN', 'VBP', 'VBZ'])
+
+
+@functools.lru_cache(maxsize=128)
+def _pos_translation(pos: str) -> str:
+    """
+    品詞タグの日本語訳をプロセス全体でキャッシュして取得する
+
+    品詞タグは数十種類の閉じた集合なので、レポートをまたいで
+    一度引いた訳を使い回せる。
+
+    Args:
+        pos (str): 品詞タグ
+
+    Returns:
+        str: 品詞タグの日本語訳
+    """
+    return sys.intern(get_config().get_pos_translation(pos))
+
 
 def format_table_row(word: Word, translation: Optional[str], pos_translation: str, example: str) -> str:
     """
@@ -25,11 +51,24 @@ def format_table_row(word: Word, translation: Optional[str], pos_translation: st
     # 単語の日本語訳がない場合は空文字列を使用
     translation = translation or "未登録"
 
-    # 例文が長い場合は省略
-    example_wrapped = textwrap.shorten(example, width=60, placeholder="...")
-
-    # return f"| {word.text:<15} | {word.count:<8} | {translation:<20} | {pos_translation:<15} | {example_wrapped:<60} |"
-    return f"| {word.text:<15} | {translation:<20} | {pos_translation:<15} | {example_wrapped:<60} |"
+    # 例文が長い場合は省略（textwrap.shortenは内部で正規表現による
+    # トークン分割を行うため、スライス+単語境界での切り詰めで置き換えている）
+    if len(example) <= 60:
+        example_wrapped = example
+    else:
+        # 単語の途中で切れないよう、57文字以内の最後の空白で切り詰める
+        truncated = example[:57]
+        cut = truncated.rsplit(' ', 1)[0] if ' ' in truncated else truncated
+        example_wrapped = cut + "..."
+
+    # 列ごとの{:<N}フォーマット指定子のパースを避け、ljust+joinで組み立てる
+    return "".join((
+        "| ", word.text.ljust(15),
+        " | ", translation.ljust(20),
+        " | ", pos_translation.ljust(15),
+        " | ", example_wrapped.ljust(60),
+        " |",
+    ))
 
 
 def generate_table_header() -> str:
@@ -46,85 +85,119 @@ def generate_table_header() -> str:
     return f"{header}\n{separator}"
 
 
-def generate_report(words: List[Word], option: str) -> List[str]:
+def generate_report(words: List[Word], option: str) -> Iterator[str]:
     """
-    単語リストからレポートの行（ヘッダー除く）を生成する
-    
+    単語リストからレポートの行（ヘッダー除く）を順次生成する
+
+    全行をリストとして保持せずジェネレータとして返すことで、
+    大きな文書でもピークメモリが行1つ分に抑えられる。
+
     Args:
         words (List[Word]): 単語オブジェクトのリスト
         option (str): オプション（例: "no_translation"）
-    
+
     Returns:
-        List[str]: 表の行（ヘッダーは含まない）
+        Iterator[str]: 表の行（ヘッダーは含まない）
     """
-    config = get_config()
+    from .dictionary import get_dictionary
     dictionary = get_dictionary()
 
-    rows: List[str] = []
+    # 先に全単語の原型を求め、重複を除いた上で日本語訳を一括取得しておく
+    for word in words:
+        word.org = dictionary.get_word_base_form(word.text, word.pos)
+    unique_orgs = dict.fromkeys(word.org for word in words)
+    translations = dictionary.get_translations_bulk(unique_orgs)
 
     # 既出の単語を記録するセット
     seen_words = set()
 
+    # ループ内で繰り返される属性解決をローカル変数に束縛しておく
+    translations_get = translations.get
+    seen_add = seen_words.add
+    fmt = format_table_row
+
+    # オプションの文字列比較は反復ごとに行わず、boolとして先に評価する
+    skip_translated = option == "no_translation"
+
     # 各単語の行を生成
     for word in words:
-        # 単語の原型を取得
-        word.org = dictionary.get_word_base_form(word.text, word.pos)
-
         # 既に処理済みの単語はスキップ
         if word.org in seen_words:
             continue
 
-        # 単語の日本語訳を取得
-        translation = dictionary.get_word_translation(word.org)
+        # 単語の日本語訳を取得（一括取得した辞書から引く）
+        translation = translations_get(word.org)
 
         # no_translationオプションが指定されている場合、翻訳が None の場合のみ出力
-        if option == "no_translation" and translation is not None:
+        if skip_translated and translation is not None:
             continue
 
-        # 品詞の日本語訳を取得
-        pos_translation = config.get_pos_translation(word.pos)
+        # 品詞の日本語訳を取得（プロセス全体のキャッシュから引く）
+        pos_translation = _pos_translation(word.pos)
 
         # 例文を1つ取得（最初の例文を使用）
         example = word.examples[0] if word.examples else ""
 
-        # 行をフォーマットして追加
-        row = format_table_row(word, translation, pos_translation, example)
-        rows.append(row)
-        seen_words.add(word.org)
-
-    return rows
+        # 行をフォーマットして返す
+        yield fmt(word, translation, pos_translation, example)
+        seen_add(word.org)
 
 
-def save_report(rows: List[str], output_path: str) -> None:
+def save_report(rows: Iterable[str], output_path: str) -> None:
     """
     レポートをファイルに保存する（ヘッダー行をこのタイミングで追加）
-    
+
+    行を結合した巨大な文字列を作らず、イテレータから逐次書き込む。
+
     Args:
-        rows (List[str]): テーブルの行（ヘッダーは含まない）
+        rows (Iterable[str]): テーブルの行（ヘッダーは含まない）
         output_path (str): 出力ファイルのパス
     """
-    header = generate_table_header()
-    content = "\n".join([header] + rows)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(generate_table_header())
+        f.writelines("\n" + row for row in rows)
 
 
 
-def get_verb_forms(word: str, pos: str, dictionary: Dictionary) -> Tuple[str, str, str]:
+def get_verb_forms(word: str, pos: str, dictionary: 'Dictionary') -> Tuple[str, str, str]:
     """
     動詞の原形、過去形、過去分詞形を取得する
-    
+
     Args:
         word (str): 動詞
         pos (str): 品詞タグ
         dictionary (Dictionary): 辞書オブジェクト
-    
+
+    Returns:
+        Tuple[str, str, str]: (原形, 過去形, 過去分詞形)
+    """
+    # 結果は決定的なので、渡された辞書インスタンスのキャッシュでメモ化する
+    # （プロセス全体ではなくインスタンス単位に持つことで、
+    #  別のDBを指すDictionaryに結果が混ざらない）
+    cache = dictionary._verb_forms_cache
+    key = (word, pos)
+    forms = cache.get(key)
+    if forms is None:
+        forms = _compute_verb_forms(word, pos, dictionary)
+        cache[key] = forms
+    return forms
+
+
+def _compute_verb_forms(word: str, pos: str, dictionary: 'Dictionary') -> Tuple[str, str, str]:
+    """
+    get_verb_formsの本体（キャッシュを介さずに計算する）
+
+    Args:
+        word (str): 動詞
+        pos (str): 品詞タグ
+        dictionary (Dictionary): 辞書オブジェクト
+
     Returns:
         Tuple[str, str, str]: (原形, 過去形, 過去分詞形)
     """
-    # 動詞の原形を取得
+    # 動詞の原形を取得（単語表の生成と同じメモ化済み検索を通す）
     try:
-        base_form = dictionary.inflector.Search(word)[0][0]
+        base_form = dictionary._get_base_form(word)
     except Exception as e:
         print('Inflector failed for word:', word, 'pos:', pos)
         raise e
@@ -168,59 +241,91 @@ def generate_verb_report(words: List[Word]) -> List[str]:
     Returns:
         Tuple[List[str], List[str]]: (不規則動詞の行リスト, 規則動詞の行リスト)
     """
+    from .dictionary import get_dictionary
     dictionary = get_dictionary()
 
-    # 動詞のみをフィルタリング
-    verb_pos_tags = ['VB', 'VBD', 'VBG', 'VBN', 'VBP', 'VBZ']
-    verbs = [word for word in words if word.pos in verb_pos_tags]
+    # 原形をキーとした行の辞書（重複チェックを兼ねる）
+    rows_by_base: Dict[str, str] = {}
 
-    # 動詞を規則変化と不規則変化に分類（行として格納）
-    regular_rows: List[str] = []
+    # ループ内で繰り返される属性解決をローカル変数に束縛しておく
+    get_forms = get_verb_forms
+    get_translation = dictionary.get_word_translation
 
-    # 処理済みの動詞の原形を記録するセット
-    processed_base_forms = set()
+    # フィルタリング・重複排除・行生成を1パスで行う（中間リストを作らない）
+    for verb in words:
+        # 動詞以外はスキップ
+        if verb.pos not in _verb_pos_tags:
+            continue
 
-    for verb in verbs:
         # 動詞の原形、過去形、過去分詞形を取得
-        base_form, past_tense, past_participle = get_verb_forms(verb.text, verb.pos, dictionary)
+        base_form, past_tense, past_participle = get_forms(verb.text, verb.pos, dictionary)
 
         # base_form が '' の場合(品詞の誤判定)はスキップ
         if base_form == '':
             continue
 
         # 既に処理済みの原形はスキップ
-        if base_form in processed_base_forms:
+        if base_form in rows_by_base:
             continue
 
-        # 処理済みとしてマーク
-        processed_base_forms.add(base_form)
-
         # 動詞の日本語訳を取得
-        translation = dictionary.get_word_translation(base_form, 'VB') or "未登録"
+        translation = get_translation(base_form, 'VB') or "未登録"
 
         # 日本語訳は30文字に制限
         translation = translation if len(translation) <= 30 else translation[:27] + "..."
 
-        row = f"| {base_form} | {past_tense} | {past_participle} | {translation} |"
-
-        regular_rows.append(row)
-
-    # アルファベット順に整列
-    regular_rows = sorted(regular_rows)
+        rows_by_base[base_form] = f"| {base_form} | {past_tense} | {past_participle} | {translation} |"
 
-    return regular_rows
+    # アルファベット順に整列（整形済みの行全体ではなく原形キーで比較する）
+    return [row for _, row in sorted(rows_by_base.items())]
 
 
-def save_full_report(lines: List[str], output_path: str) -> None:
-    content = "\n".join(lines)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+def _write_all(fd: int, data: bytes) -> None:
+    """
+    os.writeの部分書き込みを考慮してバッファ全体を書き切る
 
-from typing import Any
+    Args:
+        fd (int): 書き込み先のファイルディスクリプタ
+        data (bytes): 書き込むデータ
+    """
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def save_full_report(lines: Iterable[str], output_path: str) -> None:
+    # 行を約1MBごとにまとめてエンコードし、生のfdへ直接書き込む
+    # （TextIOWrapperの逐次エンコード・バッファ管理を介さず、
+    #  syscall回数はcontent_size/1MB程度に抑えられる）
+    flush_threshold = 1 << 20
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        buf = bytearray()
+        first = True
+        for line in lines:
+            if first:
+                first = False
+            else:
+                buf += b"\n"
+            buf += line.encode('utf-8')
+            if len(buf) >= flush_threshold:
+                _write_all(fd, bytes(buf))
+                buf.clear()
+        if buf:
+            _write_all(fd, bytes(buf))
+    finally:
+        os.close(fd)
+
+
+# escape_md_cell用のコンパイル済みパターン・変換テーブル（モジュールロード時に一度だけ構築）
+_re_md_crlf = re.compile(r'\r\n?')
+_re_md_newlines = re.compile(r'\n\n|\n')
+_md_pipe_table = str.maketrans({'|': '\\|'})
 
 
 def escape_md_cell(s: str) -> str:
-    """
+    r"""
     Markdown テーブル用セルのエスケープ。
     '|' を '\|' に、連続改行は '<br>' に。
     None は '' 扱い。
@@ -229,13 +334,12 @@ def escape_md_cell(s: str) -> str:
         return ""
     # Ensure string
     s = str(s)
-    # Normalize newlines to <br>
-    s = s.replace("\r\n", "\n").replace("\r", "\n")
-    # Collapse multiple newlines to single <br> between content
-    s = s.replace("\n\n", "\n").replace("\n", "<br>")
-    # Escape pipes
-    s = s.replace("|", "\\|")
-    return s
+    # Normalize newlines (\r\n / \r -> \n)
+    s = _re_md_crlf.sub("\n", s)
+    # Collapse newline pairs and convert to <br>
+    s = _re_md_newlines.sub("<br>", s)
+    # Escape pipes (single C-level pass)
+    return s.translate(_md_pipe_table)
 
 
 def format_grammar_points_table(items: List[Dict[str, Any]]) -> List[str]:
@@ -286,25 +390,23 @@ def generate_full_report_with_grammar(
         title: str,
         option: str,
         grammar_points: Optional[List[Dict[str, Any]]]
-) -> List[str]:
+) -> Iterator[str]:
     """
     既存の「出現単語表」「動詞一覧」に加えて、
     grammar_points があれば「文法・構文のポイント解説」セクションを末尾に追加して返す。
+
+    行のリストを組み立てず、ジェネレータとして順次生成する。
     """
-    rows = generate_report(words, option)
-    verb_rows = generate_verb_report(words)
-    parts: List[str] = []
-    parts.append(f"# {title}")
-    parts.append("")
+    yield f"# {title}"
+    yield ""
     if grammar_points:
-        parts.append("")
-        parts.extend(format_grammar_points_table(grammar_points))
-    parts.append("")
-    parts.append("## 出現単語表")
-    parts.append(generate_table_header())
-    parts.extend(rows)
-    parts.append("")
-    parts.append("## 動詞一覧")
-    parts.append(generate_verb_report_table_header())
-    parts.extend(verb_rows)
-    return parts
+        yield ""
+        yield from format_grammar_points_table(grammar_points)
+    yield ""
+    yield "## 出現単語表"
+    yield generate_table_header()
+    yield from generate_report(words, option)
+    yield ""
+    yield "## 動詞一覧"
+    yield generate_verb_report_table_header()
+    yield from generate_verb_report(words)
@@ -1,15 +1,17 @@
 """
 単語とその品詞を表現するクラス
 """
-from dataclasses import dataclass
+import sys
 from typing import List, Dict, Optional
 
 
-@dataclass
 class Word:
     """
     単語とその品詞を表現するクラス
-    
+
+    __slots__により__dict__を持たず、1インスタンスあたりのメモリを抑えている。
+    ハッシュ・等価比較に使うキーは初期化時に一度だけ計算する。
+
     Attributes:
         text (str): 単語のテキスト
         org (str): 単語の原形
@@ -17,63 +19,76 @@ class Word:
         count (int): 出現回数
         examples (List[str]): 単語が使用されている例文のリスト
     """
-    text: str
-    org: str
-    pos: str
-    count: int = 0
-    examples: List[str] = None
-    
-    def __post_init__(self):
-        """
-        初期化後の処理
-        """
-        if self.examples is None:
-            self.examples = []
-    
+
+    __slots__ = ('text', 'org', 'pos', 'count', 'examples', '_key', '_example_set')
+
+    def __init__(self, text: str, org: str, pos: str, count: int = 0,
+                 examples: List[str] = None):
+        self.text = text
+        self.org = org
+        # 品詞タグは数十種類の閉じた集合なので、インターンして
+        # 辞書キー比較をポインタ比較で済むようにする
+        self.pos = sys.intern(pos)
+        self.count = count
+        if examples is None:
+            examples = []
+        self.examples = examples
+
+        # 例文の重複チェック用セット（リストのin演算はO(n)のため）
+        self._example_set = set(examples)
+
+        # ハッシュ・等価比較のたびにf-stringとlower()を実行しないよう事前計算
+        self._key = f"{text.lower()}_{pos}"
+
+    def __repr__(self):
+        return (f"Word(text={self.text!r}, org={self.org!r}, pos={self.pos!r}, "
+                f"count={self.count!r}, examples={self.examples!r})")
+
     def add_example(self, example: str) -> None:
         """
         例文を追加する
-        
+
         Args:
             example (str): 追加する例文
         """
-        if example not in self.examples:
+        if example not in self._example_set:
+            self._example_set.add(example)
             self.examples.append(example)
-    
+
     def increment_count(self) -> None:
         """
         出現回数をインクリメントする
         """
         self.count += 1
-    
+
     def get_key(self) -> str:
         """
         単語と品詞の組み合わせを一意に識別するキーを取得する
-        
+
         Returns:
             str: 単語と品詞の組み合わせを表す文字列
         """
-        return f"{self.text.lower()}_{self.pos}"
-    
+        return self._key
+
     def __eq__(self, other):
         """
         等価比較
-        
+
         Args:
             other: 比較対象
-            
+
         Returns:
             bool: 単語と品詞が同じであれば True
         """
         if not isinstance(other, Word):
             return False
-        return self.get_key() == other.get_key()
-    
+        return self._key == other._key
+
     def __hash__(self):
         """
         ハッシュ値を取得する
-        
+
         Returns:
             int: ハッシュ値
         """
-        return hash(self.get_key())
\ No newline at end of file
+        return hash(self._key)
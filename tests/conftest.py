@@ -5,3 +5,22 @@ import sys
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
+
+
+import pytest
+
+
+@pytest.fixture(scope='session', autouse=True)
+def warm_pos_tagger():
+    """
+    セッション（xdist使用時はワーカー）ごとにPOSタガーを一度だけ温める
+
+    モデルのロードは数百ミリ秒かかるため、最初に実行される
+    テストにコストが偏らないよう先にロードしておく。
+    """
+    from src.englishstudyhelper.analyzer import get_tagger
+    try:
+        get_tagger().tag(['warm'])
+    except LookupError:
+        # NLTKデータが未取得の環境では各テスト側で同じエラーが報告される
+        pass
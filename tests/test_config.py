@@ -13,16 +13,19 @@ class TestConfig(unittest.TestCase):
     設定ファイル読み込み機能のテストケース
     """
     
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
-        テスト前の準備
+        テストクラス全体の準備
+
+        設定ファイルの内容は全テストで共通のため、クラスごとに一度だけ書き込む。
         """
         # テスト用の設定ファイルを作成
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.config_path = os.path.join(self.temp_dir.name, 'test_settings.json')
-        
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.config_path = os.path.join(cls.temp_dir.name, 'test_settings.json')
+
         # テスト用の設定データ
-        self.config_data = {
+        cls.config_data = {
             "exclude_pos": ["NNP", "IN", "DT"],
             "be_verbs": ["be", "am", "is", "are"],
             "pos_translations": {
@@ -30,24 +33,29 @@ class TestConfig(unittest.TestCase):
                 "VB": "動詞"
             }
         }
-        
+
         # 設定ファイルを書き込む
-        with open(self.config_path, 'w', encoding='utf-8') as f:
-            json.dump(self.config_data, f, ensure_ascii=False, indent=4)
-    
-    def tearDown(self):
+        with open(cls.config_path, 'w', encoding='utf-8') as f:
+            json.dump(cls.config_data, f, ensure_ascii=False, indent=4)
+
+        # Configは読み取り専用なので、ファイルの再読み込みを避けるため
+        # クラスで一つのインスタンスを共有する
+        cls.config = Config(cls.config_path)
+
+    @classmethod
+    def tearDownClass(cls):
         """
-        テスト後のクリーンアップ
+        テストクラス全体のクリーンアップ
         """
         # 一時ディレクトリを削除
-        self.temp_dir.cleanup()
+        cls.temp_dir.cleanup()
     
     def test_load_config(self):
         """
         設定ファイルの読み込みテスト
         """
-        config = Config(self.config_path)
-        
+        config = self.config
+
         # 設定データが正しく読み込まれているか確認
         self.assertEqual(config.get_exclude_pos(), self.config_data["exclude_pos"])
         self.assertEqual(config.get_be_verbs(), self.config_data["be_verbs"])
@@ -56,8 +64,8 @@ class TestConfig(unittest.TestCase):
         """
         品詞の翻訳取得テスト
         """
-        config = Config(self.config_path)
-        
+        config = self.config
+
         # 登録されている品詞の翻訳を取得
         self.assertEqual(config.get_pos_translation("NN"), "名詞")
         self.assertEqual(config.get_pos_translation("VB"), "動詞")
@@ -69,8 +77,8 @@ class TestConfig(unittest.TestCase):
         """
         単語の除外判定テスト
         """
-        config = Config(self.config_path)
-        
+        config = self.config
+
         # 除外すべき品詞
         self.assertTrue(config.should_exclude_word("test", "NNP"))
         self.assertTrue(config.should_exclude_word("test", "IN"))
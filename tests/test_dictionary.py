@@ -13,30 +13,49 @@ class TestDictionary(unittest.TestCase):
     辞書検索機能のテストケース
     """
     
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
-        テスト前の準備
+        テストクラス全体の準備
+
+        テストDBはどのテストからも変更されないため、
+        テーブル作成とINSERTはクラスごとに一度だけ行う。
         """
-        # テスト用の一時ディレクトリを作成
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.db_path = os.path.join(self.temp_dir.name, 'test_ejdict.sqlite3')
-        
+        # テスト用の一時ディレクトリを作成（存在しないDBパスのテストで使用）
+        cls.temp_dir = tempfile.TemporaryDirectory()
+
+        # テスト用のDBは共有キャッシュのインメモリDBに作る。
+        # ディスクを介さないためテスト中の全クエリがメモリ内で完結する。
+        # この保持用接続が開いている間だけDBが生存する。
+        cls.db_path = 'file:test_ejdict?mode=memory&cache=shared'
+        cls._db_holder = sqlite3.connect(cls.db_path, uri=True)
+
         # テスト用のDBを作成
-        self._create_test_db()
-        
-    def tearDown(self):
+        cls._create_test_db()
+
+        # Dictionaryは接続を保持して再利用するため、
+        # テストごとに作り直さずクラスで一つを共有する
+        cls.dictionary = Dictionary(cls.db_path)
+
+    @classmethod
+    def tearDownClass(cls):
         """
-        テスト後のクリーンアップ
+        テストクラス全体のクリーンアップ
         """
+        # 共有インスタンスの接続を閉じる
+        cls.dictionary.close()
+        # 保持用接続を閉じるとインメモリDBも破棄される
+        cls._db_holder.close()
         # 一時ディレクトリを削除
-        self.temp_dir.cleanup()
-    
-    def _create_test_db(self):
+        cls.temp_dir.cleanup()
+
+    @classmethod
+    def _create_test_db(cls):
         """
         テスト用のDBを作成する
         """
         # DBに接続
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(cls.db_path, uri=True)
         cursor = conn.cursor()
         
         # テーブルを作成
@@ -48,12 +67,7 @@ class TestDictionary(unittest.TestCase):
             level INTEGER DEFAULT 0
         )
         ''')
-        
-        # インデックスを作成
-        cursor.execute('''
-        CREATE INDEX word_index ON items (word)
-        ''')
-        
+
         # テストデータを挿入
         test_data = [
             (1, 'test', 'テスト', 1),
@@ -75,7 +89,13 @@ class TestDictionary(unittest.TestCase):
             'INSERT INTO items (item_id, word, mean, level) VALUES (?, ?, ?, ?)',
             test_data
         )
-        
+
+        # インデックスは挿入後にまとめて構築する
+        # （挿入のたびにインデックスを更新するより速い）
+        cursor.execute('''
+        CREATE INDEX word_index ON items (word)
+        ''')
+
         # 変更をコミット
         conn.commit()
         
@@ -86,7 +106,7 @@ class TestDictionary(unittest.TestCase):
         """
         単語の翻訳取得テスト
         """
-        dictionary = Dictionary(self.db_path)
+        dictionary = self.dictionary
         
         # 登録されている単語の翻訳を取得
         self.assertEqual(dictionary.get_word_translation('test'), 'テスト')
@@ -129,7 +149,7 @@ class TestDictionary(unittest.TestCase):
         """
         翻訳結果のフォーマットのテスト
         """
-        dictionary = Dictionary(self.db_path)
+        dictionary = self.dictionary
         
         # 複数の訳語がある単語の翻訳を取得
         translation = dictionary.get_word_translation('example')
@@ -153,7 +173,7 @@ class TestDictionary(unittest.TestCase):
         """
         単語の原型推測のテスト
         """
-        dictionary = Dictionary(self.db_path)
+        dictionary = self.dictionary
         
         # 名詞の複数形
         self.assertEqual(dictionary.get_word_translation('books', part_of_speech='NNS'), '本 / 予約する')
@@ -174,7 +194,7 @@ class TestDictionary(unittest.TestCase):
         """
         エッジケースのテスト
         """
-        dictionary = Dictionary(self.db_path)
+        dictionary = self.dictionary
         
         # 存在しない単語
         self.assertIsNone(dictionary.get_word_translation('nonexistent'))
@@ -195,7 +215,7 @@ class TestDictionary(unittest.TestCase):
         """
         単語の原型取得のテスト
         """
-        dictionary = Dictionary(self.db_path)
+        dictionary = self.dictionary
 
         # 名詞の複数形
         self.assertEqual(dictionary._get_base_form('books', 'NNS'), 'book')